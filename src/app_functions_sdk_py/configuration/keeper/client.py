@@ -185,7 +185,7 @@ class KeeperClient(ConfigurationClient):
             error_channel.put(config_err)
             return
 
-        messages = queue.Queue()
+        messages = queue.SimpleQueue()
         topic = os.path.join(KEEPER_TOPIC_PREFIX, self.config_base_path, wait_key, "#")
         topics = [TopicMessageQueue(topic, messages)]
 
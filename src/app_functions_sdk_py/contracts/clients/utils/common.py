@@ -20,9 +20,13 @@ Functions:
         encoding.
 """
 
+import json
 import urllib.parse
+from dataclasses import fields, is_dataclass
 from typing import Any
 
+import orjson
+
 
 def url_encode(s: str) -> str:
     """
@@ -72,6 +76,10 @@ def escape_and_join_path(api_route_path: str, *path_variables: str) -> str:
     return '/'.join(elements)
 
 
+# the builtin types which convert_any_to_dict returns as they are
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
 def convert_any_to_dict(obj: Any) -> dict[Any, dict[str, Any]] | list[dict[str, Any]] | Any:
     """
     Converts an object to a dictionary.
@@ -86,15 +94,77 @@ def convert_any_to_dict(obj: Any) -> dict[Any, dict[str, Any]] | list[dict[str,
     Returns:
         Dict[str, Any]: A dictionary representation of the input object.
     """
+    # most of the values are builtin scalars, so return them before the checks below
+    if type(obj) in _SCALAR_TYPES:
+        return obj
     if isinstance(obj, dict):
         return {k: convert_any_to_dict(v) for k, v in obj.items()}
     if hasattr(obj, '__dict__'):
         return {k: convert_any_to_dict(v) for k, v in obj.__dict__.items()}
     if isinstance(obj, list):
         return [convert_any_to_dict(e) for e in obj]
+    # dataclasses declared with slots=True have no __dict__, so convert them from their fields
+    if _is_dataclass_instance(obj):
+        return {f.name: convert_any_to_dict(getattr(obj, f.name)) for f in fields(obj)}
     return obj
 
 
+def _is_dataclass_instance(obj: Any) -> bool:
+    return is_dataclass(obj) and not isinstance(obj, type)
+
+
+def _convert_any_to_json_default(obj: Any) -> Any:
+    # orjson does not serialize subclasses of float, e.g. numpy.float64 without numpy support, so
+    # convert the numbers to the builtin types in the same way as json.dumps encodes them
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    if _is_dataclass_instance(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def convert_any_to_json(obj: Any) -> bytes:
+    """
+    Converts an object to JSON encoded bytes.
+
+    This function encodes the same values as encoding the result of convert_any_to_dict with
+    json.dumps, but the objects are converted to dictionaries inline by orjson while encoding. The
+    object graph is therefore traversed only once, without building the intermediate dictionaries.
+
+    The JSON document differs from json.dumps in these ways:
+        - It is compact, without spaces after the separators, and non-ASCII characters are
+          encoded as UTF-8 rather than escaped.
+        - Float NaN and Infinity values are encoded as null rather than NaN and Infinity.
+        - datetime, date, time, UUID, Enum and numpy values are encoded, where json.dumps raises
+          a TypeError, e.g. a datetime is encoded as an RFC 3339 string and an Enum as its value.
+
+    Parameters:
+        obj (Any): The object to be converted to JSON.
+
+    Returns:
+        bytes: The JSON encoded bytes of the input object.
+
+    Raises:
+        TypeError: If the object, or any object it references, is not JSON serializable.
+    """
+    # dataclasses are passed through to the default function, so they are converted from their
+    # __dict__ in the same way as convert_any_to_dict rather than by orjson's dataclass support
+    try:
+        return orjson.dumps(obj, default=_convert_any_to_json_default,
+                            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        # orjson rejects some values that json.dumps accepts, e.g. integers exceeding the 64-bit
+        # range which are never passed to the default function, so fall back to json.dumps
+        # keep ensure_ascii, so strings with lone surrogates are escaped rather than failing to
+        # encode to UTF-8
+        return json.dumps(convert_any_to_dict(obj), separators=(',', ':')).encode('utf-8')
+
+
 class PathBuilder:
     """
     A utility class for building API endpoint paths with properly escaped special characters.
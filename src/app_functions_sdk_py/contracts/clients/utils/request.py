@@ -52,7 +52,7 @@ from ....bootstrap.utils import convert_dict_keys_to_lower_camelcase
 from ....contracts.clients.interfaces.authinjector import AuthenticationInjector
 from ....contracts.common import constants
 from ....contracts import errors
-from ....contracts.clients.utils.common import convert_any_to_dict
+from ....contracts.clients.utils.common import convert_any_to_json
 
 
 ERROR_MSG_1 = "failed to parse baseUrl and requestPath"
@@ -581,7 +581,7 @@ def create_request_with_raw_data(ctx: dict,
         url += '?' + urlencode(request_params, doseq=True)
 
     try:
-        json_encoded_data = json.dumps(convert_any_to_dict(data)).encode('utf-8')
+        json_encoded_data = convert_any_to_json(data)
     except Exception as e:
         raise errors.new_common_edgex(errors.ErrKind.CONTRACT_INVALID,
                                       "failed to encode input data to JSON", e)
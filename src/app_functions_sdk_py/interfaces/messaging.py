@@ -11,7 +11,7 @@ Classes:
     MessageBusConfig: Configuration for the message bus, including broker information and optional
     parameters.
     MessageEnvelope: Encapsulates the data and metadata for a message, including payload and topic.
-    TopicMessageQueue: Associates a message topic with an asyncio Queue for message handling.
+    TopicMessageQueue: Associates a message topic with a Queue for message handling.
     MessageClient: Abstract base class defining the interface for message clients.
     MqttMessageClient: Concrete implementation of MessageClient for MQTT messaging.
 
@@ -22,17 +22,17 @@ Functions:
 The module also sets default values for various message bus properties and initializes the message
 bus configuration with these defaults.
 """
-import base64
 import json
 import os
-
-from queue import Queue
+import random
+import re
+from queue import Queue, SimpleQueue
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Type, TypeVar
-from uuid import uuid4
+from dataclasses import dataclass, field, is_dataclass
+from typing import List, Optional, Any, Type, TypeVar, Tuple
 
 import cbor2
+import orjson
 from dataclasses_json import dataclass_json
 
 from ..utils.deserialize import deserialize_to_dataclass
@@ -41,9 +41,9 @@ from ..contracts.common.constants import API_VERSION, CONTENT_TYPE_JSON, CONTENT
 from ..contracts.dtos.common.base import Versionable
 from ..contracts.clients.utils import common
 from ..contracts.clients.logger import Logger
-from ..utils.environment import get_env_var_as_bool
+from ..utils.environment import get_cached_env_var, get_cached_env_var_as_bool
 from ..constants import ENV_KEY_EDGEX_MSG_BASE64_PAYLOAD
-from ..utils.base64 import is_base64_encoded
+from ..utils.base64 import try_b64decode
 from ..utils.strconv import parse_bool
 
 # define constants for the message bus type
@@ -70,8 +70,27 @@ KEY_PEM_BLOCK = "KeyPEMBlock"
 CERT_PEM_BLOCK = "CertPEMBlock"
 CA_PEM_BLOCK = "CaPEMBlock"
 
+# cbor2 re-exports dumps and loads from its C extension when available, so bind them once here
+# to avoid resolving the module attributes on every message
+_cbor_dumps = cbor2.dumps
+_cbor_loads = cbor2.loads
 
-@dataclass
+# correlation IDs only need to be unique rather than cryptographically random, so they are generated
+# as version 4 UUIDs from a PRNG seeded once from os.urandom, which avoids the urandom syscall and
+# the uuid.UUID object of uuid4() per message
+_CID_RNG = random.Random(os.urandom(16))
+_UUID_V4_CLEAR_BITS = ~((0xf000 << 64) | (0xc000 << 48))
+_UUID_V4_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+# reseed in forked child processes, so they do not generate the same IDs as the parent
+os.register_at_fork(after_in_child=lambda: _CID_RNG.seed(os.urandom(16)))
+
+
+def _new_correlation_id() -> str:
+    h = f"{(_CID_RNG.getrandbits(128) & _UUID_V4_CLEAR_BITS) | _UUID_V4_SET_BITS:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(slots=True)
 class HostInfo:
     """
     Represents the host information for the message broker.
@@ -135,16 +154,40 @@ class MessageBusConfig:
 
 class TlsConfigurationOptions:
     # pylint: disable=too-few-public-methods
-    """ TLS configuration for connecting the message bus. """
+    """
+    TLS configuration for connecting the message bus.
+
+    The options are read from the optional message bus configuration on first access rather than
+    on construction, so a message client that does not use TLS never reads or parses them.
+    """
+    # maps the attribute names to the optional configuration keys and their default values
+    _OPT_MAP = {
+        "skip_cert_verify": (SKIP_CERT_VERIFY, "False"),
+        "cert_file": (CERT_FILE, ""),
+        "key_file": (KEY_FILE, ""),
+        "ca_file": (CA_FILE, ""),
+        "cert_pem_block": (CERT_PEM_BLOCK, ""),
+        "key_pem_block": (KEY_PEM_BLOCK, ""),
+        "ca_pem_block": (CA_PEM_BLOCK, ""),
+    }
+    __slots__ = ("_optional", *_OPT_MAP)
+
     def __init__(self, message_bus_config: MessageBusConfig):
-        self.skip_cert_verify = parse_bool(
-            message_bus_config.optional.get(SKIP_CERT_VERIFY, "False"))
-        self.cert_file = message_bus_config.optional.get(CERT_FILE, "")
-        self.key_file = message_bus_config.optional.get(KEY_FILE, "")
-        self.ca_file = message_bus_config.optional.get(CA_FILE, "")
-        self.cert_pem_block = message_bus_config.optional.get(CERT_PEM_BLOCK, "")
-        self.key_pem_block = message_bus_config.optional.get(KEY_PEM_BLOCK, "")
-        self.ca_pem_block = message_bus_config.optional.get(CA_PEM_BLOCK, "")
+        self._optional = message_bus_config.optional
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the options that have not been read yet, as the slots of the options
+        # read before are found by the normal attribute lookup
+        try:
+            key, default = self._OPT_MAP[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'") from None
+        value = self._optional.get(key, default)
+        if name == "skip_cert_verify":
+            value = parse_bool(value)
+        setattr(self, name, value)
+        return value
 
 
 @dataclass_json
@@ -193,10 +236,7 @@ class MessageEnvelope(Versionable):
         """
         Converts the message payload to a byte array based on the content type.
         """
-        try:
-            self.payload = convert_msg_payload_to_byte_array(self.contentType, self.payload)
-        except ValueError as e:
-            raise e
+        self.payload = convert_msg_payload_to_byte_array(self.contentType, self.payload)
 
 
 T = TypeVar('T')
@@ -213,13 +253,19 @@ def get_msg_payload(msg: MessageEnvelope, target_type: Type[T]) -> T:
             return payload
 
         if isinstance(payload, bytes):
-            if is_base64_encoded(payload):
-                decoded_value = base64.b64decode(payload)
+            decoded_value = try_b64decode(payload)
+            if decoded_value is not None:
                 if target_type == bytes:
                     return decoded_value
                 return unmarshal_msg_payload(msg.contentType, decoded_value, target_type)
             return unmarshal_msg_payload(msg.contentType, payload, target_type)
 
+        # coerce dicts and objects to the target type directly, rather than marshaling them to
+        # bytes and unmarshaling those bytes again. dicts are converted as well, as they may hold
+        # dataclass instances.
+        if isinstance(payload, dict) or hasattr(payload, '__dict__') or is_dataclass(payload):
+            return deserialize_to_dataclass(common.convert_any_to_dict(payload), target_type)
+
         marshaled_data = marshal_msg_payload(msg.contentType, payload)
         return unmarshal_msg_payload(msg.contentType, marshaled_data, target_type)
 
@@ -231,23 +277,65 @@ def convert_msg_payload_to_byte_array(content_type: str, payload: Any) -> bytes:
     """
     Converts the message payload to a byte array based on the content type.
     """
-    if isinstance(payload, bytes):
+    # check the exact builtin types first, as an identity check of the type is cheaper than
+    # isinstance, and fall back to isinstance for their subclasses before marshaling
+    t = type(payload)
+    if t is bytes:
         return payload
+    if t is str:
+        return payload.encode('utf-8')
+    if t is bytearray or t is memoryview:
+        return bytes(payload)
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return bytes(payload)
     if isinstance(payload, str):
         return payload.encode('utf-8')
     return marshal_msg_payload(content_type, payload)
 
 
+def _marshal_json(payload: Any) -> bytes:
+    return common.convert_any_to_json(payload)
+
+
+# orjson decodes integers exceeding the 64-bit range as floats, which loses precision, so JSON
+# documents with a run of 20 or more digits are decoded by json.loads to keep such integers exact
+_LONG_DIGITS = re.compile(rb'\d{20}')
+_LONG_DIGITS_STR = re.compile(r'\d{20}')
+
+
+def _unmarshal_json(payload: bytes | str) -> Any:
+    long_digits = _LONG_DIGITS_STR if isinstance(payload, str) else _LONG_DIGITS
+    if long_digits.search(payload) is not None:
+        return json.loads(payload)
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        # orjson rejects some documents that json.loads accepts, e.g. NaN and Infinity values,
+        # numbers exceeding the float range and lone surrogate escapes, so fall back to json.loads
+        return json.loads(payload)
+
+
+# map the supported content types to the serializer functions, so the marshal and unmarshal
+# functions dispatch with a single dict lookup rather than comparing against each content type
+_MARSHALERS = {
+    CONTENT_TYPE_JSON: _marshal_json,
+    CONTENT_TYPE_CBOR: _cbor_dumps,
+}
+_UNMARSHALERS = {
+    CONTENT_TYPE_JSON: _unmarshal_json,
+    CONTENT_TYPE_CBOR: _cbor_loads,
+}
+
+
 def marshal_msg_payload(content_type: str, payload: Any) -> bytes:
     """
     Marshal the message payload based on the content type.
     """
     try:
-        if content_type == CONTENT_TYPE_JSON:
-            return json.dumps(common.convert_any_to_dict(payload)).encode('utf-8')
-        if content_type == CONTENT_TYPE_CBOR:
-            return cbor2.dumps(payload)
-        raise ValueError(f"Unsupported content type: {content_type}")
+        marshaler = _MARSHALERS.get(content_type)
+        if marshaler is None:
+            raise ValueError(f"Unsupported content type: {content_type}")
+        return marshaler(payload)
     except (UnicodeEncodeError, cbor2.CBORError, TypeError, ValueError) as e:
         raise ValueError(f'Failed to marshal to {content_type}, error: {e}') from e
 
@@ -257,18 +345,17 @@ def unmarshal_msg_payload(content_type: str, payload: bytes, target_type: Type[T
     Unmarshal the message payload based on the content type and target type.
     """
     try:
-        if content_type == CONTENT_TYPE_JSON:
-            data = json.loads(payload.decode('utf-8'))
-        elif content_type == CONTENT_TYPE_CBOR:
-            data = cbor2.loads(payload)
-        else:
+        unmarshaler = _UNMARSHALERS.get(content_type)
+        if unmarshaler is None:
             raise ValueError(f"Unsupported content type: {content_type}")
+        data = unmarshaler(payload)
 
         if isinstance(data, target_type):
             return data
         return deserialize_to_dataclass(data, target_type)
 
-    except (TypeError, ValueError, UnicodeDecodeError, json.JSONDecodeError, cbor2.CBORError) as e:
+    except (TypeError, ValueError, UnicodeDecodeError, orjson.JSONDecodeError,
+            cbor2.CBORError) as e:
         raise ValueError(f'Failed to unmarshal payload to {target_type.__name__}: {e}') from e
 
 
@@ -287,57 +374,70 @@ def new_message_envelope(lc: Logger, payload: Any, content_type: str = CONTENT_T
 
     """
     message = MessageEnvelope()
-    message.correlationID = str(uuid4())
+    message.correlationID = _new_correlation_id()
     message.contentType = content_type
     message.payload = payload
 
     # EDGEX_MSG_BASE64_PAYLOAD=true will only cause the message envelope published to
     # EdgeX message bus with a base64-encoded payload, e.g. service metrics.
-    base64payload, _ = get_env_var_as_bool(lc, ENV_KEY_EDGEX_MSG_BASE64_PAYLOAD, False)
+    base64payload, _ = get_cached_env_var_as_bool(lc, ENV_KEY_EDGEX_MSG_BASE64_PAYLOAD, False)
     if base64payload:
         message.convert_msg_payload_to_byte_array()
 
     return message
 
 
+def _message_envelope_from_dict(d: dict) -> MessageEnvelope:
+    # construct the MessageEnvelope directly rather than through the reflection based from_dict
+    # function of dataclass_json, as this is called for every received message. Keys that are not
+    # MessageEnvelope fields are ignored and missing keys fall back to the field defaults.
+    # note that if the payload is decoded as str, we need to encode it back to bytes
+    payload_val = d.get("payload")
+    if isinstance(payload_val, str):
+        payload_val = payload_val.encode()
+    return MessageEnvelope(receivedTopic=d.get("receivedTopic", ""),
+                           correlationID=d.get("correlationID", ""),
+                           requestID=d.get("requestID", ""),
+                           errorCode=d.get("errorCode", 0),
+                           payload=payload_val,
+                           contentType=d.get("contentType", CONTENT_TYPE_JSON),
+                           queryParams=d.get("queryParams"),
+                           apiVersion=d.get("apiVersion", API_VERSION))
+
+
 def decode_message_envelope(payload: bytes):
     """
     Decodes a message payload into a MessageEnvelope object.
     """
-    if os.getenv(ENV_MESSAGE_CBOR_ENCODE) == VALUE_TRUE:
-        data = cbor2.loads(payload)
-        return MessageEnvelope(**data)
-
-    # decode the message payload into a dict using json.loads
-    payload_json_decoded = json.loads(payload.decode())
-    # note that if the payload_json_decoded["payload"] is decoded as str by json.loads
-    # we need to encode it back to bytes
-    if isinstance(payload_json_decoded["payload"], str):
-        payload_json_decoded["payload"] = payload_json_decoded["payload"].encode()
-    # the MessageEnvelope is declared with @dataclass_json, so we can use the handy
-    # from_dict function to create a MessageEnvelope object from the decoded dict
-    message_envelope = MessageEnvelope.from_dict(payload_json_decoded)  # pylint: disable=no-member
-    return message_envelope
+    if get_cached_env_var(ENV_MESSAGE_CBOR_ENCODE) == VALUE_TRUE:
+        return _message_envelope_from_dict(_cbor_loads(payload))
 
-@dataclass
+    # decode the message payload into a dict using orjson.loads where possible, which accepts
+    # bytes directly
+    return _message_envelope_from_dict(_unmarshal_json(payload))
+
+
+@dataclass(slots=True)
 class TopicMessageQueue:
     """
-    Associates a message topic with an asyncio Queue for message handling.
+    Associates a message topic with a Queue for message handling.
 
-    This class is designed to hold messages for a specific topic in an asyncio Queue, facilitating
-    asynchronous message processing. It provides a straightforward way to manage the flow of
-    messages by topic, ensuring that messages are processed in the order they are received.
+    This class is designed to hold messages for a specific topic in a thread-safe Queue, which the
+    message client puts received messages into from its network thread and the consumer threads
+    get them from. It provides a straightforward way to manage the flow of messages by topic,
+    ensuring that messages are processed in the order they are received.
 
     Attributes:
         topic (str): The message topic associated with this queue.
-        message_queue (asyncio.Queue): The asyncio Queue that holds messages for the associated
-        topic.
+        message_queue (Queue | SimpleQueue): The Queue that holds messages for the associated
+        topic. A SimpleQueue is preferred, as its put and get are implemented in C without the
+        locking and task tracking of Queue.
 
     Methods:
         There are no methods defined in this class other than the constructor.
     """
     topic: str
-    message_queue: Queue
+    message_queue: Queue | SimpleQueue
 
 
 class MessageClient(ABC):
@@ -353,6 +453,8 @@ class MessageClient(ABC):
         connect: Establishes a connection to the message bus.
         publish(message: MessageEnvelope, topic: str): Publishes a message to a specified topic on
         the message bus.
+        publish_batch(messages: List[Tuple[MessageEnvelope, str]]): Publishes a batch of messages,
+        each to its own topic, on the message bus.
         subscribe(topics: List[TopicMessageQueue]): Subscribes to a list of topics on the message
         bus.
         unsubscribe(topics: List[str]): Unsubscribes from a list of topics on the message bus.
@@ -381,6 +483,21 @@ class MessageClient(ABC):
 
         """
 
+    @abstractmethod
+    def publish_batch(self, messages: List[Tuple[MessageEnvelope, str]]):
+        """
+        Publishes a batch of messages on the message bus.
+
+        This method should implement the logic necessary to publish several messages in one call,
+        so that the message client can amortize the per-message cost of waiting for confirmations
+        from the message bus.
+
+        Args:
+            messages (List[Tuple[MessageEnvelope, str]]): A list of tuples of the message envelope
+            to be published and the topic to which it should be published.
+
+        """
+
     @abstractmethod
     def subscribe(self, topic_queues: List[TopicMessageQueue], error_queue: Queue):
         """
@@ -305,10 +305,7 @@ class Service(ApplicationService):
             for topic in topics
         ]
 
-        try:
-            self.runtime.add_function_pipeline(pipeline_id, full_topics, *functions)
-        except Exception as err:
-            raise err
+        self.runtime.add_function_pipeline(pipeline_id, full_topics, *functions)
 
         self._logger.debug(
             f"Pipeline '{pipeline_id}' added for topics '{full_topics}' "
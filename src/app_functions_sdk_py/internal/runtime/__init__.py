@@ -5,7 +5,6 @@ This module provides the classes and functions for App Functions Runtime
 """
 
 import json
-import os
 import threading
 import time
 from copy import deepcopy
@@ -40,6 +39,7 @@ from ...interfaces import FunctionPipeline, AppFunctionContext, AppFunction, cal
     payload_with_correct_content_type
 from ...interfaces.messaging import MessageEnvelope, get_msg_payload
 from ...sync.waitgroup import WaitGroup
+from ...utils.environment import get_cached_env_var
 
 DEFAULT_MIN_RETRY_INTERVAL = 1
 
@@ -230,7 +230,7 @@ class FunctionsPipelineRuntime:
             request_dto = get_msg_payload(payload_with_correct_content_type(envelope), AddEventRequest)
             event = request_dto.event
 
-            if os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
+            if get_cached_env_var(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
                 # recover the reduced fields for the AddEventRequest
                 for r in event.readings:
                     r.deviceName = event.deviceName
@@ -137,11 +137,8 @@ class Client(StoreClient):
 
 def new_sqlite_client(path: str, lc: Logger) -> StoreClient:
     """ Create a sqlite client """
-    try:
-        # using thread lock instead of check_same_thread
-        conn = sqlite3.connect(path, check_same_thread=False)
-    except Exception as e:
-        raise e
+    # using thread lock instead of check_same_thread
+    conn = sqlite3.connect(path, check_same_thread=False)
     return Client(conn, lc)
 
 
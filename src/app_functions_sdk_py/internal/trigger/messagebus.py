@@ -89,7 +89,7 @@ class MessageBusTrigger(Trigger):
         for topic in topics:
             topic = join_str([config.MessageBus.BaseTopicPrefix, topic],
                              TOPIC_LEVEL_SEPERATOR)
-            topic_queue = TopicMessageQueue(topic, queue.Queue())
+            topic_queue = TopicMessageQueue(topic, queue.SimpleQueue())
             self.topic_queues.append(topic_queue)
             logger.info(f"subscribing to topic '{topic}'")
 
@@ -26,6 +26,9 @@ Constants:
     RETAINED (str): Key for specifying if messages are retained by the broker for new subscribers.
     CLEAN_SESSION (str): Key for specifying if the broker removes all information about the client
     when it disconnects.
+    CONFIRM_MODE (str): Key for specifying how the client waits for published messages to be
+    confirmed, one of CONFIRM_MODE_NONE, CONFIRM_MODE_ASYNC, CONFIRM_MODE_SYNC or
+    CONFIRM_MODE_BATCH.
 """
 # common constants for messagebus.Optional properties
 USERNAME = "Username"
@@ -38,3 +41,18 @@ KEEP_ALIVE = "KeepAlive"
 RETAINED = "Retained"
 CLEAN_SESSION = "CleanSession"
 AUTH_MODE = "AuthMode"
+CONFIRM_MODE = "ConfirmMode"
+
+# define the publish confirm modes
+# none: publish without checking whether the message was queued for delivery
+CONFIRM_MODE_NONE = "none"
+# async: publish without waiting, but fail if the message was dropped rather than queued for
+# delivery
+CONFIRM_MODE_ASYNC = "async"
+# sync: wait for each message to be confirmed before publishing the next one. In the sync and batch
+# modes, messages which paho keeps queued for delivery on reconnect are not waited for.
+CONFIRM_MODE_SYNC = "sync"
+# batch: publish all the messages of a batch, then wait for all of them to be confirmed; a single
+# published message is not waited for, in the same way as the async mode
+CONFIRM_MODE_BATCH = "batch"
+CONFIRM_MODES = (CONFIRM_MODE_NONE, CONFIRM_MODE_ASYNC, CONFIRM_MODE_SYNC, CONFIRM_MODE_BATCH)
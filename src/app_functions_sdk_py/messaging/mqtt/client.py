@@ -26,19 +26,20 @@ Usage:
     subscribe to topics, and handle incoming messages as defined by the application's requirements.
 """
 import base64
-import json
 import queue
 import ssl
 import threading
-from dataclasses import asdict
-from queue import Queue
-from typing import List, Any
+import time
+from queue import Queue, SimpleQueue
+from typing import List, Any, Tuple
 
 import paho.mqtt.client as mqtt
 from paho.mqtt.enums import CallbackAPIVersion
 
 from . import USERNAME, PASSWORD, CLIENT_ID, QOS, KEEP_ALIVE, RETAINED, AUTO_RECONNECT, \
-    CLEAN_SESSION, CONNECT_TIMEOUT
+    CLEAN_SESSION, CONNECT_TIMEOUT, CONFIRM_MODE, CONFIRM_MODES, CONFIRM_MODE_NONE, \
+    CONFIRM_MODE_ASYNC, CONFIRM_MODE_SYNC, CONFIRM_MODE_BATCH
+from ...contracts.clients.utils import common
 from ...interfaces.messaging import (MessageBusConfig, MessageClient, MessageEnvelope,
                                      TopicMessageQueue, AUTH_MODE_USERNAME_PASSWORD,
                                      AUTH_MODE_CLIENT_CERT, AUTH_MODE_CACERT,
@@ -63,7 +64,10 @@ class MQTTClientOptions:
         broker.
         clean_session (bool): If True, the broker removes all information about this client when it
         disconnects.
-        connect_timeout (int): Maximum time in seconds to wait for a connection to succeed.
+        connect_timeout (int): Maximum time in seconds to wait for a connection to succeed, and for
+        a published message, or all the messages of a published batch, to be confirmed.
+        confirm_mode (str): How to wait for published messages to be confirmed, one of 'none',
+        'async', 'sync' or 'batch'.
         skip_cert_verify (bool): If True, SSL/TLS certificate verification is skipped.
         cert_file (str): Path to the client's certificate file for SSL/TLS.
         key_file (str): Path to the client's private key file for SSL/TLS.
@@ -87,6 +91,11 @@ class MQTTClientOptions:
         self.auto_reconnect = parse_bool(message_bus_config.optional.get(AUTO_RECONNECT, "True"))
         self.clean_session = parse_bool(message_bus_config.optional.get(CLEAN_SESSION, "True"))
         self.connect_timeout = parse_int(message_bus_config.optional.get(CONNECT_TIMEOUT, "5"))
+        self.confirm_mode = message_bus_config.optional.get(
+            CONFIRM_MODE, CONFIRM_MODE_ASYNC).lower()
+        if self.confirm_mode not in CONFIRM_MODES:
+            raise ValueError(f"Invalid {CONFIRM_MODE} '{self.confirm_mode}', must be one of "
+                             f"{', '.join(CONFIRM_MODES)}")
         self.tls_config = TlsConfigurationOptions(message_bus_config)
 
 
@@ -126,7 +135,8 @@ def _on_connect(client: mqtt.Client, userdata: Any,
         client.message_callback_add(topic, userdata[topic])
 
 
-def _new_message_handler(message_queue: Queue, error_queue: Queue) -> mqtt.CallbackOnMessage:
+def _new_message_handler(message_queue: Queue | SimpleQueue,
+                         error_queue: Queue) -> mqtt.CallbackOnMessage:
     """
     Creates a new message handler for the MQTT client.
 
@@ -158,6 +168,7 @@ class MqttMessageClient(MessageClient):
     Methods:
         connect(): Establishes a connection to the MQTT broker.
         publish(message: MessageEnvelope, topic: str): Publishes a message to a specified topic.
+        publish_batch(messages: List[Tuple[MessageEnvelope, str]]): Publishes a batch of messages.
         subscribe(topic_queues: List[TopicMessageQueue]): Subscribes to a list of topics.
         unsubscribe(topics: List[str]): Unsubscribes from a list of topics.
         disconnect(): Disconnects from the MQTT broker.
@@ -188,18 +199,68 @@ class MqttMessageClient(MessageClient):
         except ValueError as ve:
             raise RuntimeError(f"Failed to connect to MQTT broker: {ve}") from ve
 
+    def _publish(self, message: MessageEnvelope, topic: str) -> mqtt.MQTTMessageInfo:
+        if isinstance(message.payload, bytes):
+            message.payload = base64.b64encode(message.payload).decode('utf-8')
+        # convert_any_to_json encodes the envelope in a single pass, rather than deep copying it
+        # into a dict through asdict and then encoding that dict, and keeps the underscore
+        # prefixed fields of dataclass payloads
+        marshaled_message = common.convert_any_to_json(message)
+        info = self._client.publish(topic=topic,
+                                    payload=marshaled_message,
+                                    qos=self._client_options.qos,
+                                    retain=self._client_options.retained)
+        # with QoS > 0, paho keeps the message queued for delivery on reconnect even though it
+        # returns MQTT_ERR_NO_CONN while disconnected, so only fail if the message was dropped
+        if self._client_options.confirm_mode != CONFIRM_MODE_NONE and \
+                info.rc != mqtt.MQTT_ERR_SUCCESS and \
+                (self._client_options.qos == 0 or info.rc == mqtt.MQTT_ERR_QUEUE_SIZE):
+            raise RuntimeError(f"Failed to publish message to MQTT broker: "
+                               f"{mqtt.error_string(info.rc)}")
+        return info
+
+    def _new_confirm_deadline(self) -> float:
+        return time.monotonic() + self._client_options.connect_timeout
+
+    @staticmethod
+    def _wait_for_publish(info: mqtt.MQTTMessageInfo, deadline: float):
+        # a message which was not sent but kept queued by paho, e.g. with QoS > 0 while
+        # disconnected, is only delivered on reconnect, so it is not waited for. paho's
+        # wait_for_publish would fail for it at once, though the message is still delivered.
+        if info.rc != mqtt.MQTT_ERR_SUCCESS:
+            return
+        info.wait_for_publish(max(deadline - time.monotonic(), 0))
+        if not info.is_published():
+            raise RuntimeError(f"Timed out waiting for message {info.mid} to be published to "
+                               f"MQTT broker")
+
     def publish(self, message: MessageEnvelope, topic: str):
         try:
-            if isinstance(message.payload, bytes):
-                message.payload = base64.b64encode(message.payload).decode('utf-8')
-            marshaled_message = json.dumps(asdict(message))
-            self._client.publish(topic=topic,
-                                 payload=marshaled_message,
-                                 qos=self._client_options.qos,
-                                 retain=self._client_options.retained)
+            info = self._publish(message, topic)
+            # the batch mode only waits for the messages published through publish_batch
+            if self._client_options.confirm_mode == CONFIRM_MODE_SYNC:
+                self._wait_for_publish(info, self._new_confirm_deadline())
         except (ValueError, TypeError) as e:
             raise RuntimeError(f"Failed to publish message to MQTT broker: {e}") from e
 
+    def publish_batch(self, messages: List[Tuple[MessageEnvelope, str]]):
+        try:
+            # the messages of a batch are confirmed within a single ConnectTimeout, rather than
+            # waiting up to ConnectTimeout for each of them
+            deadline = self._new_confirm_deadline()
+            pending = []
+            for message, topic in messages:
+                info = self._publish(message, topic)
+                if self._client_options.confirm_mode == CONFIRM_MODE_SYNC:
+                    self._wait_for_publish(info, deadline)
+                elif self._client_options.confirm_mode == CONFIRM_MODE_BATCH:
+                    pending.append(info)
+            # all the messages of the batch are in flight at once, so wait for them together
+            for info in pending:
+                self._wait_for_publish(info, deadline)
+        except (ValueError, TypeError) as e:
+            raise RuntimeError(f"Failed to publish messages to MQTT broker: {e}") from e
+
     def subscribe(self, topic_queues: List[TopicMessageQueue], error_queue: queue.Queue):
         with self._subscription_mutex:
             try:
@@ -6,7 +6,7 @@ import asyncio
 import queue
 import ssl
 import threading
-from typing import List
+from typing import List, Tuple
 
 from nats.aio.client import Client as NATS
 from nats.aio.subscription import Subscription
@@ -159,6 +159,23 @@ class NatsMessageClient(MessageClient):
         except Exception as e:
             raise ConnectionError("Failed to publish to NATS") from e
 
+    def publish_batch(self, messages: List[Tuple[MessageEnvelope, str]]):
+        async def _run_publish_batch():
+            # publish all the messages from a single task, so the batch is scheduled on the event
+            # loop once rather than once per message
+            for message, topic in messages:
+                payload = convert_msg_payload_to_byte_array(message.contentType, message.payload)
+                await self._client.publish(subject=topic, payload=payload)
+
+        loop = asyncio.get_event_loop()
+        try:
+            if loop.is_running():
+                loop.create_task(_run_publish_batch())
+            else:
+                loop.run_until_complete(_run_publish_batch())
+        except Exception as e:
+            raise ConnectionError("Failed to publish to NATS") from e
+
     def subscribe(self, topic_queues: List[TopicMessageQueue], error_queue: queue.Queue):  # pylint: disable=invalid-overridden-method
         async def _run_subscribe():
             self._logger.info(f"entering _run_subscribe. client.is_connected "
@@ -216,7 +233,8 @@ class NatsMessageClient(MessageClient):
         except Exception as e:
             raise ConnectionError("Failed to disconnect from NATS") from e
 
-def _new_message_handler(message_queue: queue.Queue, error_queue: queue.Queue):
+def _new_message_handler(message_queue: queue.Queue | queue.SimpleQueue,
+                         error_queue: queue.Queue):
     """ Creates a new message handler for the Nats client """
     async def on_message(msg):
         try:
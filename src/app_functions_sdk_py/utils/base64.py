@@ -6,14 +6,55 @@ This module provides utility functions for handling base64 encoding.
 """
 
 import base64
+import binascii
+import string
+from typing import Optional
+
+_PAD = ord("=")
+
+
+def _new_reject_table(alphabet: bytes) -> bytes:
+    """ builds a bytes.translate table mapping the alphabet bytes to 0 and all others to 1 """
+    table = bytearray(b"\x01" * 256)
+    for b in alphabet:
+        table[b] = 0
+    return bytes(table)
+
+
+_B64_REJECT = _new_reject_table(
+    (string.ascii_letters + string.digits + "+/=").encode())
+_B64_URLSAFE_REJECT = _new_reject_table(
+    (string.ascii_letters + string.digits + "-_=").encode())
+
+
+def try_b64decode(data: bytes, urlsafe: bool = False) -> Optional[bytes]:
+    """
+    try_b64decode validates and decodes the input data in a single pass. It returns the decoded
+    bytes if the input data is base64 encoded, otherwise None. Set urlsafe to True to use the
+    URL and filesystem safe alphabet, which substitutes - for + and _ for /.
+    """
+    # base64 encoded data is always padded to a multiple of 4 bytes, so reject anything else
+    # before calling into the decoder
+    size = len(data)
+    if size % 4 != 0:
+        return None
+    try:
+        # translate the input through the reject table in C, so any byte outside the alphabet
+        # shows up as 1 without looping over the input in Python
+        if b"\x01" in data.translate(_B64_URLSAFE_REJECT if urlsafe else _B64_REJECT):
+            return None
+        # padding is only allowed as the last one or two bytes
+        pad = data.find(b"=")
+        if pad != -1 and (size - pad > 2 or data[-1] != _PAD):
+            return None
+        # the input is already validated, so skip the regex validation of b64decode
+        if urlsafe:
+            return base64.urlsafe_b64decode(data)
+        return base64.b64decode(data)
+    except (binascii.Error, TypeError, ValueError):
+        return None
 
 
 def is_base64_encoded(data: bytes) -> bool:
     """ is_base64_encoded checks if the input data is base64 encoded """
-    # to check if incoming bytes is base64 encoded or not, we can decode, then re-encode. If the
-    # re-encoded string is equal to the encoded string, then it is base64 encoded.
-    try:
-        return base64.b64encode(base64.b64decode(data)) == data
-    except Exception:  # pylint: disable=broad-except
-        # for cases where exception raised, we can assume it is not base64 encoded so return False
-        return False
+    return try_b64decode(data) is not None
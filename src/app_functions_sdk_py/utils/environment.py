@@ -5,23 +5,60 @@
 This module provides utility functions for handling environment variables.
 """
 
+import functools
 import os
+from typing import Optional
 
 from app_functions_sdk_py.contracts.clients.logger import Logger
 
 
+def _parse_env_bool(env_value: str) -> Optional[bool]:
+    """ parses the environment variable value as a boolean, or returns None if invalid """
+    env_value = env_value.lower()
+    if env_value == "true":
+        return True
+    if env_value == "false":
+        return False
+    return None
+
+
+def _env_value_as_bool(logger: Logger, var_name: str, env_value: Optional[str],
+                       default_value: bool) -> (bool, bool):
+    """ converts the environment variable value to a boolean, falling back to the default """
+    if env_value is not None:
+        result = _parse_env_bool(env_value)
+        if result is not None:
+            return result, True
+        logger.warn(f"Invalid value for environment variable {var_name}: {env_value}. Using "
+                       f"default value {default_value}")
+    return default_value, False
+
+
 def get_env_var_as_bool(logger: Logger, var_name: str, default_value: bool) -> (bool, bool):
     """
     Helper function to get the value of an environment variable as a boolean.
     If the environment variable is not set or contains an invalid value, the default value is
     returned.
     """
-    env_value = os.environ.get(var_name)
-    if env_value is not None:
-        if env_value.lower() == "true":
-            return True, True
-        if env_value.lower() == "false":
-            return False, True
-        logger.warn(f"Invalid value for environment variable {var_name}: {env_value}. Using "
-                       f"default value {default_value}")
-    return default_value, False
+    return _env_value_as_bool(logger, var_name, os.environ.get(var_name), default_value)
+
+
+@functools.lru_cache(maxsize=64)
+def get_cached_env_var(var_name: str) -> Optional[str]:
+    """
+    Helper function to get the value of an environment variable for use on the message hot paths.
+    The value is read once and cached until reset_env_var_cache is called.
+    """
+    return os.environ.get(var_name)
+
+
+def get_cached_env_var_as_bool(logger: Logger, var_name: str, default_value: bool) -> (bool, bool):
+    """
+    Same as get_env_var_as_bool, but the environment variable is read through get_cached_env_var.
+    """
+    return _env_value_as_bool(logger, var_name, get_cached_env_var(var_name), default_value)
+
+
+def reset_env_var_cache():
+    """ reset_env_var_cache clears the cached environment variable values """
+    get_cached_env_var.cache_clear()
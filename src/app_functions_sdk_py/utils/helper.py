@@ -3,17 +3,16 @@
 """
 This module provides help functions
 """
-import os
 import base64
-import json
 from typing import Any, Optional, Tuple
 
 from ..constants import ENV_KEY_SECURITY_SECRET_STORE
 from ..contracts import errors
-from ..contracts.clients.utils.common import convert_any_to_dict
+from ..contracts.clients.utils.common import convert_any_to_json
 from ..contracts.common import constants
 from ..contracts.common.constants import ENV_OPTIMIZE_EVENT_PAYLOAD, VALUE_TRUE
 from ..contracts.dtos.event import Event
+from .environment import get_cached_env_var
 
 value_types = [
     constants.VALUE_TYPE_BOOL, constants.VALUE_TYPE_STRING,
@@ -32,6 +31,32 @@ value_types = [
     constants.VALUE_TYPE_OBJECT, constants.VALUE_TYPE_OBJECT_ARRAY,
 ]
 
+# maps the casefolded value types to the normalized value types
+_VALUE_TYPE_MAP = {v.casefold(): v for v in value_types}
+
+# the reading fields which are always omitted from an optimized Event payload, as the Event carries
+# the same values
+_OMITTED_READING_KEYS = frozenset({"id", "deviceName", "profileName"})
+
+
+def _optimized_event_dict(event: Event) -> dict[str, Any]:
+    """ builds the dict of an Event with the reduced readings of an optimized Event payload """
+    origin = event.origin
+    single = len(event.readings) == 1
+    readings = []
+    # build the reading dicts without the omitted keys rather than converting the whole readings
+    # and deleting the keys afterward; the remaining values are converted by convert_any_to_json
+    for r in event.readings:
+        reading = {k: v for k, v in r.__dict__.items() if k not in _OMITTED_READING_KEYS}
+        if reading["origin"] == origin:
+            del reading["origin"]
+        if single and reading["resourceName"] == event.sourceName:
+            del reading["resourceName"]
+        readings.append(reading)
+    any_dict = dict(event.__dict__)
+    any_dict["readings"] = readings
+    return any_dict
+
 
 def coerce_type(param: Any) -> Tuple[bytes, Optional[errors.EdgeX]]:
     """ CoerceType will accept a string, bytes, or json.Marshaller type and
@@ -49,21 +74,11 @@ def coerce_type(param: Any) -> Tuple[bytes, Optional[errors.EdgeX]]:
                 if r.valueType == constants.VALUE_TYPE_BINARY:
                     r.binaryValue = base64.b64encode(r.binaryValue).decode()
 
-        any_dict = convert_any_to_dict(param)
-
-        if isinstance(param, Event) and os.getenv(ENV_OPTIMIZE_EVENT_PAYLOAD) == VALUE_TRUE:
-            # reduce the fields by removing the dict key
-            for r in any_dict["readings"]:
-                del r["id"]
-                del r["deviceName"]
-                del r["profileName"]
-                if any_dict["origin"] == r["origin"]:
-                    del r["origin"]
-                if len(any_dict["readings"]) == 1 and any_dict["sourceName"] == r["resourceName"]:
-                    del r["resourceName"]
-
-        json_encoded_data = json.dumps(any_dict).encode('utf-8')
-        return json_encoded_data, None
+        if not isinstance(param, Event) or \
+                get_cached_env_var(ENV_OPTIMIZE_EVENT_PAYLOAD) != VALUE_TRUE:
+            return convert_any_to_json(param), None
+
+        return convert_any_to_json(_optimized_event_dict(param)), None
     except TypeError as e:
         return bytes(), errors.new_common_edgex(
             errors.ErrKind.CONTRACT_INVALID,
@@ -72,9 +87,9 @@ def coerce_type(param: Any) -> Tuple[bytes, Optional[errors.EdgeX]]:
 
 def normalize_value_type(value_type: str) -> Tuple[str, Optional[errors.EdgeX]]:
     """ NormalizeValueType normalizes the valueType to upper camel case """
-    for v in value_types:
-        if value_type.casefold() == v.casefold():
-            return v, None
+    v = _VALUE_TYPE_MAP.get(value_type.casefold())
+    if v is not None:
+        return v, None
     return "", errors.new_common_edgex(
         errors.ErrKind.CONTRACT_INVALID,
         f"unable to normalize the unknown value type {value_type}")
@@ -82,15 +97,9 @@ def normalize_value_type(value_type: str) -> Tuple[str, Optional[errors.EdgeX]]:
 
 def is_security_enabled() -> bool:
     """ IsSecurityEnabled returns whether security is enabled """
-    env = os.getenv(ENV_KEY_SECURITY_SECRET_STORE)
-    return env != "false"
+    return get_cached_env_var(ENV_KEY_SECURITY_SECRET_STORE) != "false"
 
 
 def delete_empty_and_trim(str_list: list[str]) -> list[str]:
     """ delete_empty_and_trim removes empty strings from a slice """
-    result = []
-    for s in str_list:
-        s = s.strip()
-        if s != "":
-            result.append(s)
-    return result
+    return list(filter(None, map(str.strip, str_list)))
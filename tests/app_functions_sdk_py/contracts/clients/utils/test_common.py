@@ -1,10 +1,14 @@
 # Copyright (C) 2024 IOTech Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import unittest
 from dataclasses import dataclass
 
-from src.app_functions_sdk_py.contracts.clients.utils.common import url_encode, escape_and_join_path, PathBuilder
+import numpy as np
+
+from src.app_functions_sdk_py.contracts.clients.utils.common import url_encode, escape_and_join_path, PathBuilder, \
+    convert_any_to_dict, convert_any_to_json
 
 
 class TestUrlEncode(unittest.TestCase):
@@ -72,5 +76,60 @@ class TestPathBuild(unittest.TestCase):
                 self.assertEqual(tt.expected_path, res)
 
 
+class TestConvertAnyToDict(unittest.TestCase):
+
+    def test_convert_any_to_dict(self):
+        @dataclass(slots=True)
+        class Slotted:
+            name: str = "slotted"
+            values: list = None
+
+        target = {"slotted": Slotted(values=[1, 2.5, None, True, b"x"]), "name": "n"}
+        self.assertEqual({"slotted": {"name": "slotted", "values": [1, 2.5, None, True, b"x"]},
+                          "name": "n"}, convert_any_to_dict(target))
+
+
+class TestConvertAnyToJson(unittest.TestCase):
+
+    def test_convert_any_to_json(self):
+        @dataclass
+        class Inner:
+            _private: str = "private"
+            values: list = None
+
+        class Outer:  # pylint: disable=too-few-public-methods
+            def __init__(self):
+                self.name = "outer"
+                self.inner = [Inner(values=[1, 2.5, None]), Inner()]
+                self.mapping = {"key": Inner(), 1: True}
+
+        target = Outer()
+        expected = json.loads(json.dumps(convert_any_to_dict(target)))
+        self.assertEqual(expected, json.loads(convert_any_to_json(target)))
+        self.assertEqual("private", expected["inner"][0]["_private"])
+
+    def test_convert_any_to_json_numpy(self):
+        target = {"float": np.float64(1.5), "int": np.int64(2), "values": [np.float32(0.5)]}
+        self.assertEqual({"float": 1.5, "int": 2, "values": [0.5]},
+                         json.loads(convert_any_to_json(target)))
+
+    def test_convert_any_to_json_wide_int(self):
+        target = {"value": 2 ** 70, "name": "wide"}
+        self.assertEqual(target, json.loads(convert_any_to_json(target)))
+
+    def test_convert_any_to_json_wide_int_with_surrogate(self):
+        target = {"value": 2 ** 70, "text": "\udcff"}
+        self.assertEqual(target, json.loads(convert_any_to_json(target)))
+
+    def test_convert_any_to_json_nan(self):
+        target = {"nan": float("nan"), "inf": float("inf"), "value": 1.5}
+        self.assertEqual({"nan": None, "inf": None, "value": 1.5},
+                         json.loads(convert_any_to_json(target)))
+
+    def test_convert_any_to_json_not_serializable(self):
+        with self.assertRaises(TypeError):
+            convert_any_to_json({"key": b"bytes"})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,31 @@
+# Copyright (C) 2025 IOTech Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+
+import numpy as np
+
+from src.app_functions_sdk_py.contracts.clients.utils.request import create_request_with_raw_data
+from src.app_functions_sdk_py.contracts.common import constants
+from src.app_functions_sdk_py.contracts.dtos.resourceproperties import ResourceProperties
+
+
+class TestCreateRequestWithRawData(unittest.TestCase):
+
+    def test_create_request_with_raw_data_numpy_fields(self):
+        data = ResourceProperties(valueType="Float64", minimum=np.float64(0),
+                                  maximum=np.float64(100.5))
+        req = create_request_with_raw_data({}, "POST", "http://localhost:59881",
+                                           "/api/v3/test", {"limit": ["10"]}, data)
+        self.assertEqual("http://localhost:59881/api/v3/test?limit=10", req.url)
+        self.assertEqual(constants.CONTENT_TYPE_JSON, req.headers[constants.CONTENT_TYPE])
+        body = json.loads(req.data)
+        self.assertEqual("Float64", body["valueType"])
+        self.assertEqual(0.0, body["minimum"])
+        self.assertEqual(100.5, body["maximum"])
+        self.assertIsNone(body["mask"])
+
+
+if __name__ == '__main__':
+    unittest.main()
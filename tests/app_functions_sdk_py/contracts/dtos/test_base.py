@@ -0,0 +1,17 @@
+# Copyright (C) 2025 IOTech Ltd
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from src.app_functions_sdk_py.contracts.dtos.common.base import Versionable
+
+
+class TestVersionable(unittest.TestCase):
+
+    def test_versionable(self):
+        self.assertEqual("", Versionable().apiVersion)
+        self.assertEqual("v3", Versionable(apiVersion="v3").apiVersion)
+        self.assertEqual("v3", Versionable.from_dict({"apiVersion": "v3"}).apiVersion)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -163,7 +163,7 @@ class TestBatch(unittest.TestCase):
                     self.assertIsNotNone(result)
 
                     self.assertTrue(isinstance(result, list))
-                    expected = list(map(lambda e: json.dumps(convert_any_to_dict(e)).encode('utf-8'), events))
+                    expected = list(map(lambda e: json.dumps(convert_any_to_dict(e), separators=(',', ':')).encode('utf-8'), events))
                     self.assertEqual(expected, result)
 
     def test_batch_in_time_and_count_mode_time_elapsed(self):
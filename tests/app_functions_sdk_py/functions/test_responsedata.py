@@ -68,7 +68,7 @@ class TestCompression(unittest.TestCase):
 
     def test_set_event(self):
         event = new_event("profile1", "dev1", "source1")
-        expected = json.dumps(convert_any_to_dict(event)).encode()
+        expected = json.dumps(convert_any_to_dict(event), separators=(',', ':')).encode()
         target = responsedata.ResponseData("")
 
         continue_pipeline, result = target.set_response_data(self.ctx, event)
@@ -0,0 +1,189 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import base64
+import json
+import math
+import os
+import unittest
+import uuid
+from dataclasses import asdict, dataclass, field
+from unittest.mock import MagicMock, patch
+
+import cbor2
+
+from src.app_functions_sdk_py.contracts.clients.utils.common import convert_any_to_dict, convert_any_to_json
+from src.app_functions_sdk_py.contracts.common.constants import API_VERSION, CONTENT_TYPE_JSON, \
+    CONTENT_TYPE_CBOR, ENV_MESSAGE_CBOR_ENCODE, VALUE_TRUE
+from src.app_functions_sdk_py.interfaces.messaging import (MessageEnvelope, decode_message_envelope,
+                                                           get_msg_payload, marshal_msg_payload,
+                                                           unmarshal_msg_payload, new_message_envelope,
+                                                           MessageBusConfig, HostInfo, TlsConfigurationOptions,
+                                                           CA_FILE, SKIP_CERT_VERIFY,
+                                                           convert_msg_payload_to_byte_array)
+from src.app_functions_sdk_py.contracts.dtos.event import Event
+from src.app_functions_sdk_py.contracts.dtos.requests.event import AddEventRequest
+from src.app_functions_sdk_py.utils.environment import reset_env_var_cache
+
+
+@dataclass
+class _Reading:
+    resourceName: str = ""
+    value: str = ""
+
+
+@dataclass
+class _Event:
+    id: str = ""
+    readings: list[_Reading] = field(default_factory=list)
+
+
+class TestMessaging(unittest.TestCase):
+
+    def test_decode_message_envelope(self):
+        payload = {"key": "value"}
+        envelope = MessageEnvelope(correlationID="123", requestID="456",
+                                   payload=base64.b64encode(json.dumps(payload).encode()).decode(),
+                                   queryParams={"q": "1"})
+        data = json.dumps(asdict(envelope)).encode()
+
+        actual = decode_message_envelope(data)
+        self.assertEqual("123", actual.correlationID)
+        self.assertEqual("456", actual.requestID)
+        self.assertEqual(0, actual.errorCode)
+        self.assertEqual(CONTENT_TYPE_JSON, actual.contentType)
+        self.assertEqual({"q": "1"}, actual.queryParams)
+        self.assertEqual(API_VERSION, actual.apiVersion)
+        self.assertIsInstance(actual.payload, bytes)
+        self.assertEqual(payload, get_msg_payload(actual, dict))
+
+    def test_decode_message_envelope_missing_fields(self):
+        actual = decode_message_envelope(b'{"correlationID": "123"}')
+        self.assertEqual("123", actual.correlationID)
+        self.assertEqual("", actual.receivedTopic)
+        self.assertIsNone(actual.payload)
+        self.assertEqual(API_VERSION, actual.apiVersion)
+
+    def test_decode_message_envelope_cbor(self):
+        data = cbor2.dumps({"correlationID": "123", "payload": b"\x00\x01", "unknown": "value"})
+        reset_env_var_cache()
+        try:
+            with patch.dict(os.environ, {ENV_MESSAGE_CBOR_ENCODE: VALUE_TRUE}):
+                actual = decode_message_envelope(data)
+        finally:
+            reset_env_var_cache()
+        self.assertEqual("123", actual.correlationID)
+        self.assertEqual(b"\x00\x01", actual.payload)
+        self.assertEqual(CONTENT_TYPE_JSON, actual.contentType)
+        self.assertEqual(API_VERSION, actual.apiVersion)
+
+    def test_get_msg_payload_from_dict(self):
+        envelope = MessageEnvelope(payload={"id": "1", "unknown": "value",
+                                            "readings": [{"resourceName": "r1", "value": "10"}]})
+        actual = get_msg_payload(envelope, _Event)
+        self.assertEqual(_Event(id="1", readings=[_Reading(resourceName="r1", value="10")]), actual)
+
+    def test_get_msg_payload_from_dict_of_dataclasses(self):
+        envelope = MessageEnvelope(payload={"id": "1", "readings": [_Reading(resourceName="r1")]})
+        actual = get_msg_payload(envelope, _Event)
+        self.assertEqual(_Event(id="1", readings=[_Reading(resourceName="r1")]), actual)
+
+        event = Event(id="e1", deviceName="device1")
+        actual = get_msg_payload(MessageEnvelope(payload={"event": event}), AddEventRequest)
+        self.assertEqual(event, actual.event)
+
+    def test_get_msg_payload_from_dataclass(self):
+        event = _Event(id="1", readings=[_Reading(resourceName="r1", value="10")])
+        envelope = MessageEnvelope(payload=event)
+        self.assertIs(event, get_msg_payload(envelope, _Event))
+        self.assertEqual({"id": "1", "readings": [{"resourceName": "r1", "value": "10"}]},
+                         get_msg_payload(envelope, dict))
+
+    def test_convert_msg_payload_to_byte_array(self):
+        self.assertEqual(b"abc", convert_msg_payload_to_byte_array(CONTENT_TYPE_JSON, b"abc"))
+        self.assertEqual(b"abc", convert_msg_payload_to_byte_array(CONTENT_TYPE_JSON, "abc"))
+        for payload in (bytearray(b"abc"), memoryview(b"abc")):
+            actual = convert_msg_payload_to_byte_array(CONTENT_TYPE_JSON, payload)
+            self.assertIs(bytes, type(actual))
+            self.assertEqual(b"abc", actual)
+        self.assertEqual({"key": "value"},
+                         json.loads(convert_msg_payload_to_byte_array(CONTENT_TYPE_JSON,
+                                                                      {"key": "value"})))
+
+    def test_marshal_unmarshal_json(self):
+        payload = {"key": "value", "list": [1, 2.5, None, True]}
+        data = marshal_msg_payload(CONTENT_TYPE_JSON, payload)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(payload, json.loads(data))
+        self.assertEqual(payload, unmarshal_msg_payload(CONTENT_TYPE_JSON, data, dict))
+
+    def test_marshal_unmarshal_cbor(self):
+        payload = {"key": "value", "binary": b"\x00\x01"}
+        data = marshal_msg_payload(CONTENT_TYPE_CBOR, payload)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(payload, unmarshal_msg_payload(CONTENT_TYPE_CBOR, data, dict))
+
+    def test_unmarshal_json_wide_int(self):
+        payload = {"v": 2 ** 64 + 1, "list": [-(2 ** 70)]}
+        data = marshal_msg_payload(CONTENT_TYPE_JSON, payload)
+        self.assertEqual(payload, unmarshal_msg_payload(CONTENT_TYPE_JSON, data, dict))
+        self.assertEqual({"v": 18446744073709551617},
+                         unmarshal_msg_payload(CONTENT_TYPE_JSON,
+                                               b'{"v": 18446744073709551617}', dict))
+
+    def test_unmarshal_json_non_standard_values(self):
+        actual = unmarshal_msg_payload(CONTENT_TYPE_JSON,
+                                       b'{"nan": NaN, "inf": Infinity, "big": 1e400, '
+                                       b'"text": "\\ud800"}', dict)
+        self.assertTrue(math.isnan(actual["nan"]))
+        self.assertEqual(math.inf, actual["inf"])
+        self.assertEqual(math.inf, actual["big"])
+        self.assertEqual("\ud800", actual["text"])
+
+    def test_decode_message_envelope_non_standard_values(self):
+        actual = decode_message_envelope(b'{"correlationID": "123", '
+                                         b'"errorCode": 18446744073709551617, '
+                                         b'"queryParams": {"v": NaN}}')
+        self.assertEqual("123", actual.correlationID)
+        self.assertEqual(18446744073709551617, actual.errorCode)
+        self.assertTrue(math.isnan(actual.queryParams["v"]))
+
+    def test_unmarshal_invalid_json(self):
+        with self.assertRaises(ValueError):
+            unmarshal_msg_payload(CONTENT_TYPE_JSON, b'{"key": ', dict)
+
+    def test_unsupported_content_type(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported content type: text/plain"):
+            marshal_msg_payload("text/plain", {"key": "value"})
+        with self.assertRaisesRegex(ValueError, "Unsupported content type: text/plain"):
+            unmarshal_msg_payload("text/plain", b'{"key": "value"}', dict)
+
+    def test_new_message_envelope_correlation_id(self):
+        logger = MagicMock()
+        ids = set()
+        for _ in range(100):
+            envelope = new_message_envelope(logger, {"key": "value"})
+            correlation_id = uuid.UUID(envelope.correlationID)
+            self.assertEqual(4, correlation_id.version)
+            self.assertEqual(uuid.RFC_4122, correlation_id.variant)
+            self.assertEqual(str(correlation_id), envelope.correlationID)
+            ids.add(envelope.correlationID)
+        self.assertEqual(100, len(ids))
+
+    def test_message_envelope_to_dict(self):
+        envelope = MessageEnvelope(correlationID="123", payload={"key": "value"})
+        self.assertEqual("123", convert_any_to_dict(envelope)["correlationID"])
+        self.assertEqual({"key": "value"}, json.loads(convert_any_to_json(envelope))["payload"])
+
+    def test_tls_configuration_options(self):
+        config = MessageBusConfig(HostInfo(), "mqtt", {SKIP_CERT_VERIFY: "true", CA_FILE: "ca.pem"})
+        options = TlsConfigurationOptions(config)
+        self.assertTrue(options.skip_cert_verify)
+        self.assertEqual("ca.pem", options.ca_file)
+        self.assertEqual("", options.cert_file)
+        self.assertEqual("", options.key_pem_block)
+        self.assertFalse(hasattr(options, "__dict__"))
+        with self.assertRaises(AttributeError):
+            _ = options.unknown
+
+        options = TlsConfigurationOptions(MessageBusConfig(HostInfo(), "mqtt", {}))
+        self.assertFalse(options.skip_cert_verify)
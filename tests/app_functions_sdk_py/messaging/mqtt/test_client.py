@@ -0,0 +1,149 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import json
+import unittest
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+import paho.mqtt.client as mqtt
+
+from src.app_functions_sdk_py.interfaces.messaging import (MessageBusConfig, HostInfo, MQTT,
+                                                           MessageEnvelope, get_msg_payload,
+                                                           decode_message_envelope)
+from src.app_functions_sdk_py.messaging.mqtt import CONFIRM_MODE, CONFIRM_MODE_SYNC, \
+    CONFIRM_MODE_BATCH, QOS, CONNECT_TIMEOUT
+from src.app_functions_sdk_py.messaging.mqtt.client import MqttMessageClient
+
+
+class TestMqttMessageClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = self.new_client({})
+
+    @staticmethod
+    def new_client(optional: dict) -> MqttMessageClient:
+        client = MqttMessageClient(MessageBusConfig(HostInfo(), MQTT, optional))
+        client._client = MagicMock()  # pylint: disable=protected-access
+        client._client.publish.return_value.rc = mqtt.MQTT_ERR_SUCCESS  # pylint: disable=protected-access
+        return client
+
+    def test_publish(self):
+        payload = {"key": "value"}
+        message = MessageEnvelope(correlationID="123", payload=b'{"key": "value"}')
+        self.client.publish(message, "test/topic")
+
+        mock_publish = self.client._client.publish  # pylint: disable=protected-access
+        mock_publish.assert_called_once()
+        self.assertEqual("test/topic", mock_publish.call_args.kwargs["topic"])
+        actual = decode_message_envelope(mock_publish.call_args.kwargs["payload"])
+        self.assertEqual("123", actual.correlationID)
+        self.assertEqual(payload, get_msg_payload(actual, dict))
+
+    def test_publish_dict_payload(self):
+        payload = {"key": "value", 1: [1, 2]}
+        self.client.publish(MessageEnvelope(payload=payload), "test/topic")
+
+        mock_publish = self.client._client.publish  # pylint: disable=protected-access
+        actual = decode_message_envelope(mock_publish.call_args.kwargs["payload"])
+        self.assertEqual({"key": "value", "1": [1, 2]}, get_msg_payload(actual, dict))
+
+    def test_publish_dataclass_payload(self):
+        @dataclass
+        class Payload:
+            _hidden: int = 1
+            shown: int = 2
+
+        self.client.publish(MessageEnvelope(payload=Payload()), "test/topic")
+
+        mock_publish = self.client._client.publish  # pylint: disable=protected-access
+        published = json.loads(mock_publish.call_args.kwargs["payload"])
+        self.assertEqual({"_hidden": 1, "shown": 2}, published["payload"])
+
+    def test_publish_not_queued(self):
+        mock_publish = self.client._client.publish  # pylint: disable=protected-access
+        mock_publish.return_value.rc = mqtt.MQTT_ERR_NO_CONN
+        with self.assertRaises(RuntimeError):
+            self.client.publish(MessageEnvelope(payload=b"test"), "test/topic")
+
+    def test_publish_queued_while_disconnected(self):
+        client = self.new_client({QOS: "1"})
+        mock_publish = client._client.publish  # pylint: disable=protected-access
+        mock_publish.return_value.rc = mqtt.MQTT_ERR_NO_CONN
+        client.publish(MessageEnvelope(payload=b"test"), "test/topic")
+        mock_publish.assert_called_once()
+
+        mock_publish.return_value.rc = mqtt.MQTT_ERR_QUEUE_SIZE
+        with self.assertRaises(RuntimeError):
+            client.publish(MessageEnvelope(payload=b"test"), "test/topic")
+
+    def test_publish_confirmed_while_disconnected(self):
+        for mode in (CONFIRM_MODE_SYNC, CONFIRM_MODE_BATCH):
+            with self.subTest(msg=mode):
+                client = self.new_client({QOS: "1", CONFIRM_MODE: mode})
+                # paho keeps the message queued for delivery on reconnect, but returns NO_CONN
+                info = mqtt.MQTTMessageInfo(1)
+                info.rc = mqtt.MQTT_ERR_NO_CONN
+                client._client.publish.return_value = info  # pylint: disable=protected-access
+                client.publish(MessageEnvelope(payload=b"test"), "test/topic")
+                client.publish_batch([(MessageEnvelope(payload=b"test"), "topic/0"),
+                                      (MessageEnvelope(payload=b"test"), "topic/1")])
+
+    def test_publish_batch_confirmed(self):
+        client = self.new_client({CONFIRM_MODE: CONFIRM_MODE_BATCH})
+        info = mqtt.MQTTMessageInfo(1)
+        info._set_as_published()  # pylint: disable=protected-access
+        client._client.publish.return_value = info  # pylint: disable=protected-access
+        client.publish_batch([(MessageEnvelope(payload=b"test"), "topic/0"),
+                              (MessageEnvelope(payload=b"test"), "topic/1")])
+
+    def test_publish_batch_confirm_timeout(self):
+        client = self.new_client({CONFIRM_MODE: CONFIRM_MODE_BATCH, CONNECT_TIMEOUT: "0"})
+        client._client.publish.return_value = mqtt.MQTTMessageInfo(1)  # pylint: disable=protected-access
+        with self.assertRaisesRegex(RuntimeError, "Timed out waiting for message 1"):
+            client.publish_batch([(MessageEnvelope(payload=b"test"), "topic/0")])
+
+    def test_publish_confirm_mode(self):
+        tests = [
+            ("async", {}, 0),
+            ("sync", {CONFIRM_MODE: CONFIRM_MODE_SYNC}, 1),
+            ("batch", {CONFIRM_MODE: CONFIRM_MODE_BATCH}, 0),
+        ]
+        for name, optional, expected_waits in tests:
+            with self.subTest(msg=name):
+                client = self.new_client(optional)
+                client.publish(MessageEnvelope(payload=b"test"), "test/topic")
+
+                mock_publish = client._client.publish  # pylint: disable=protected-access
+                self.assertEqual(expected_waits,
+                                 mock_publish.return_value.wait_for_publish.call_count)
+
+    def test_publish_batch(self):
+        tests = [
+            ("async", {}, 0),
+            ("sync", {CONFIRM_MODE: CONFIRM_MODE_SYNC}, 3),
+            ("batch", {CONFIRM_MODE: CONFIRM_MODE_BATCH}, 3),
+        ]
+        for name, optional, expected_waits in tests:
+            with self.subTest(msg=name):
+                client = self.new_client(optional)
+                messages = [(MessageEnvelope(correlationID=str(i), payload=b"test"), f"topic/{i}")
+                            for i in range(3)]
+                client.publish_batch(messages)
+
+                mock_publish = client._client.publish  # pylint: disable=protected-access
+                self.assertEqual(3, mock_publish.call_count)
+                self.assertEqual(["topic/0", "topic/1", "topic/2"],
+                                 [c.kwargs["topic"] for c in mock_publish.call_args_list])
+                self.assertEqual(expected_waits,
+                                 mock_publish.return_value.wait_for_publish.call_count)
+
+    def test_publish_batch_not_confirmed(self):
+        client = self.new_client({CONFIRM_MODE: CONFIRM_MODE_BATCH})
+        mock_publish = client._client.publish  # pylint: disable=protected-access
+        mock_publish.return_value.is_published.return_value = False
+        with self.assertRaises(RuntimeError):
+            client.publish_batch([(MessageEnvelope(payload=b"test"), "test/topic")])
+
+    def test_invalid_confirm_mode(self):
+        with self.assertRaises(ValueError):
+            MqttMessageClient(MessageBusConfig(HostInfo(), MQTT, {CONFIRM_MODE: "unknown"}))
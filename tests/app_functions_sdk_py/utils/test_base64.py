@@ -0,0 +1,36 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import base64
+import unittest
+
+from src.app_functions_sdk_py.utils.base64 import try_b64decode, is_base64_encoded
+
+
+class TestBase64(unittest.TestCase):
+
+    def test_try_b64decode(self):
+        raw = b'{"key": "value"}'
+        encoded = base64.b64encode(raw)
+        self.assertEqual(raw, try_b64decode(encoded))
+        self.assertTrue(is_base64_encoded(encoded))
+
+    def test_try_b64decode_not_encoded(self):
+        for data in [b'{"key": "value"}', b'abc', b'ab c', b'ab\ncd==', b'!!!!', b'-_-_']:
+            with self.subTest(data=data):
+                self.assertIsNone(try_b64decode(data))
+                self.assertFalse(is_base64_encoded(data))
+
+    def test_try_b64decode_padding(self):
+        self.assertEqual(b'A', try_b64decode(b'QQ=='))
+        self.assertEqual(b'AB', try_b64decode(b'QUI='))
+        for data in [b'====', b'QQ==QQ==', b'Q=Q=', b'=QQQ']:
+            with self.subTest(data=data):
+                self.assertIsNone(try_b64decode(data))
+
+    def test_try_b64decode_urlsafe(self):
+        raw = b'\xfb\xff\xbf'
+        encoded = base64.urlsafe_b64encode(raw)
+        self.assertEqual(b'-_-_', encoded)
+        self.assertIsNone(try_b64decode(encoded))
+        self.assertEqual(raw, try_b64decode(encoded, urlsafe=True))
+        self.assertIsNone(try_b64decode(base64.b64encode(raw), urlsafe=True))
@@ -0,0 +1,47 @@
+#  Copyright (C) 2025 IOTech Ltd
+#  SPDX-License-Identifier: Apache-2.0
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.app_functions_sdk_py.utils import environment
+
+
+class TestEnvironment(unittest.TestCase):
+
+    def setUp(self):
+        environment.reset_env_var_cache()
+
+    def tearDown(self):
+        environment.reset_env_var_cache()
+
+    def test_get_cached_env_var_as_bool(self):
+        logger = MagicMock()
+        with patch.dict('os.environ', {'TEST_ENV_VAR': 'True'}):
+            result, override = environment.get_cached_env_var_as_bool(logger, 'TEST_ENV_VAR',
+                                                                      False)
+        self.assertTrue(result)
+        self.assertTrue(override)
+
+        # the value is cached until the cache is reset
+        with patch.dict('os.environ', {'TEST_ENV_VAR': 'False'}):
+            result, override = environment.get_cached_env_var_as_bool(logger, 'TEST_ENV_VAR',
+                                                                      False)
+            self.assertTrue(result)
+            self.assertTrue(override)
+            environment.reset_env_var_cache()
+            result, override = environment.get_cached_env_var_as_bool(logger, 'TEST_ENV_VAR',
+                                                                      True)
+        self.assertFalse(result)
+        self.assertTrue(override)
+        logger.warn.assert_not_called()
+
+    @patch.dict('os.environ', {'TEST_ENV_VAR': 'abc'})
+    def test_get_cached_env_var_as_bool_invalid(self):
+        logger = MagicMock()
+        for _ in range(2):
+            result, override = environment.get_cached_env_var_as_bool(logger, 'TEST_ENV_VAR',
+                                                                      True)
+            self.assertTrue(result)
+            self.assertFalse(override)
+        # the warning is logged on every call rather than cached with the value
+        self.assertEqual(2, logger.warn.call_count)
@@ -1,13 +1,20 @@
 #  Copyright (C) 2024 IOTech Ltd
 #  SPDX-License-Identifier: Apache-2.0
+import json
+import os
 import unittest
 import uuid
+from unittest.mock import patch
 
 from src.app_functions_sdk_py.bootstrap.container.logging import LoggingClientInterfaceName
 from src.app_functions_sdk_py.bootstrap.di.container import Container
 from src.app_functions_sdk_py.utils import helper
 from src.app_functions_sdk_py.contracts.clients.logger import EdgeXLogger, DEBUG
 from src.app_functions_sdk_py.functions.context import Context
+from src.app_functions_sdk_py.contracts.common.constants import ENV_OPTIMIZE_EVENT_PAYLOAD, VALUE_TRUE
+from src.app_functions_sdk_py.contracts.dtos.event import Event
+from src.app_functions_sdk_py.contracts.dtos.reading import BaseReading
+from src.app_functions_sdk_py.utils.environment import reset_env_var_cache
 
 
 class TestHelper(unittest.TestCase):
@@ -27,3 +34,57 @@ class TestHelper(unittest.TestCase):
         self.assertEqual(2, len(results))
         self.assertEqual("Hel lo", results[0])
         self.assertEqual("test", results[1])
+
+    def test_normalize_value_type(self):
+        for value_type in ["int8", "INT8", "Int8"]:
+            result, err = helper.normalize_value_type(value_type)
+            self.assertIsNone(err)
+            self.assertEqual("Int8", result)
+        result, err = helper.normalize_value_type("Float32Array".upper())
+        self.assertIsNone(err)
+        self.assertEqual("Float32Array", result)
+        result, err = helper.normalize_value_type("unknown")
+        self.assertIsNotNone(err)
+        self.assertEqual("", result)
+
+    def test_coerce_type_lone_surrogate(self):
+        data, err = helper.coerce_type({"v": "\udcff"})
+        self.assertIsNone(err)
+        self.assertEqual({"v": "\udcff"}, json.loads(data))
+
+    def _coerce_optimized_event(self, event: Event) -> dict:
+        reset_env_var_cache()
+        try:
+            with patch.dict(os.environ, {ENV_OPTIMIZE_EVENT_PAYLOAD: VALUE_TRUE}):
+                data, err = helper.coerce_type(event)
+        finally:
+            reset_env_var_cache()
+        self.assertIsNone(err)
+        return json.loads(data)
+
+    def test_coerce_type_optimized_event(self):
+        event = Event(id="e1", deviceName="d1", profileName="p1", sourceName="s1", origin=1)
+        event.readings = [
+            BaseReading(resourceName="r1", valueType="Int8", origin=1, deviceName="d1",
+                        profileName="p1", id="r1id", value="1"),
+            BaseReading(resourceName="r2", valueType="Int8", origin=2, deviceName="d1",
+                        profileName="p1", id="r2id", value="2"),
+        ]
+        actual = self._coerce_optimized_event(event)
+        self.assertEqual("e1", actual["id"])
+        self.assertEqual("d1", actual["deviceName"])
+        for r in actual["readings"]:
+            for key in ("id", "deviceName", "profileName"):
+                self.assertNotIn(key, r)
+        self.assertNotIn("origin", actual["readings"][0])
+        self.assertEqual(2, actual["readings"][1]["origin"])
+        self.assertEqual("r1", actual["readings"][0]["resourceName"])
+        # the Event itself is left unchanged
+        self.assertEqual("r1id", event.readings[0].id)
+
+    def test_coerce_type_optimized_event_single_reading(self):
+        event = Event(deviceName="d1", sourceName="r1", origin=1)
+        event.readings = [BaseReading(resourceName="r1", valueType="Int8", origin=1, value="1")]
+        actual = self._coerce_optimized_event(event)
+        self.assertNotIn("resourceName", actual["readings"][0])
+        self.assertEqual("1", actual["readings"][0]["value"])